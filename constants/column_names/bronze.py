@@ -31,3 +31,26 @@ SCENARIO_HISTORICAL = "historical"
 SCENARIO_SSP1_2_6 = "ssp1_2_6"
 SCENARIO_SSP2_4_5 = "ssp2_4_5"
 SCENARIO_SSP5_8_5 = "ssp5_8_5"
+
+__all__ = (
+    "BRONZE_YIELD_DEPARTMENT",
+    "BRONZE_YIELD_YEAR",
+    "BRONZE_YIELD_YIELD",
+    "BRONZE_YIELD_AREA",
+    "BRONZE_YIELD_PRODUCTION",
+    "BRONZE_YIELD_UNNAMED_0",
+    "BRONZE_CLIMATE_SCENARIO",
+    "BRONZE_CLIMATE_NOM_DEP",
+    "BRONZE_CLIMATE_CODE_DEP",
+    "BRONZE_CLIMATE_TIME",
+    "BRONZE_CLIMATE_YEAR",
+    "BRONZE_CLIMATE_METRIC",
+    "BRONZE_CLIMATE_VALUE",
+    "BRONZE_METRIC_TEMP_MEAN",
+    "BRONZE_METRIC_TEMP_MAX",
+    "BRONZE_METRIC_PRECIP",
+    "SCENARIO_HISTORICAL",
+    "SCENARIO_SSP1_2_6",
+    "SCENARIO_SSP2_4_5",
+    "SCENARIO_SSP5_8_5",
+)
@@ -4,8 +4,15 @@ DASHBOARD_DEPARTMENT_NAME = "nom_dep"
 DASHBOARD_YEAR = "year"
 DASHBOARD_YIELD = "predicted_yield"
 
-DASHBOARD_COLUMNS = [
+DASHBOARD_COLUMNS = (
     DASHBOARD_DEPARTMENT_NAME,
     DASHBOARD_YEAR,
     DASHBOARD_YIELD,
-]
+)
+
+__all__ = (
+    "DASHBOARD_DEPARTMENT_NAME",
+    "DASHBOARD_YEAR",
+    "DASHBOARD_YIELD",
+    "DASHBOARD_COLUMNS",
+)
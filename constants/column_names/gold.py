@@ -47,3 +47,50 @@ GOLD_TEMP_STD_NON_GROWING = "temp_std_non_growing"
 # ---------------------------------------------------------------------------
 GOLD_TOTAL_PRECIP_GROWING = "total_precip_growing"
 GOLD_TOTAL_PRECIP_NON_GROWING = "total_precip_non_growing"
+
+# ---------------------------------------------------------------------------
+# Model features (in the column order of the gold datasets)
+# ---------------------------------------------------------------------------
+GOLD_FEATURE_COLUMNS = (
+    GOLD_NOM_DEP,
+    GOLD_DRY_PERIODS_COUNT,
+    GOLD_MAX_DRY_SPELL_DAYS,
+    GOLD_FREEZE_DAYS_COUNT,
+    GOLD_HEAT_DAYS_COUNT,
+    GOLD_HEAVY_RAIN_DAYS_COUNT,
+    GOLD_TEMP_MAX_GROWING,
+    GOLD_TEMP_MAX_NON_GROWING,
+    GOLD_TEMP_MEAN_GROWING,
+    GOLD_TEMP_MEAN_NON_GROWING,
+    GOLD_TEMP_MIN_GROWING,
+    GOLD_TEMP_MIN_NON_GROWING,
+    GOLD_TEMP_STD_GROWING,
+    GOLD_TEMP_STD_NON_GROWING,
+    GOLD_TOTAL_PRECIP_GROWING,
+    GOLD_TOTAL_PRECIP_NON_GROWING,
+    GOLD_WINTER_PRECIP_TOTAL,
+)
+
+__all__ = (
+    "GOLD_NOM_DEP",
+    "GOLD_YEAR",
+    "GOLD_SCENARIO",
+    "GOLD_YIELD",
+    "GOLD_DRY_PERIODS_COUNT",
+    "GOLD_MAX_DRY_SPELL_DAYS",
+    "GOLD_FREEZE_DAYS_COUNT",
+    "GOLD_HEAT_DAYS_COUNT",
+    "GOLD_HEAVY_RAIN_DAYS_COUNT",
+    "GOLD_WINTER_PRECIP_TOTAL",
+    "GOLD_TEMP_MEAN_GROWING",
+    "GOLD_TEMP_MEAN_NON_GROWING",
+    "GOLD_TEMP_MIN_GROWING",
+    "GOLD_TEMP_MIN_NON_GROWING",
+    "GOLD_TEMP_MAX_GROWING",
+    "GOLD_TEMP_MAX_NON_GROWING",
+    "GOLD_TEMP_STD_GROWING",
+    "GOLD_TEMP_STD_NON_GROWING",
+    "GOLD_TOTAL_PRECIP_GROWING",
+    "GOLD_TOTAL_PRECIP_NON_GROWING",
+    "GOLD_FEATURE_COLUMNS",
+)
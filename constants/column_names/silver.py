@@ -24,3 +24,17 @@ SILVER_TIME = "time"
 SILVER_TEMP_MEAN = "temp_mean"
 SILVER_TEMP_MAX = "temp_max"
 SILVER_PRECIP = "precip"
+
+__all__ = (
+    "SILVER_NOM_DEP",
+    "SILVER_YEAR",
+    "SILVER_YIELD",
+    "SILVER_AREA",
+    "SILVER_PRODUCTION",
+    "SILVER_SCENARIO",
+    "SILVER_CODE_DEP",
+    "SILVER_TIME",
+    "SILVER_TEMP_MEAN",
+    "SILVER_TEMP_MAX",
+    "SILVER_PRECIP",
+)
@@ -46,3 +46,29 @@ RANDOM_STATE = 42  # For reproducibility of model training
 # Streamlit app
 # ---------------------------------------------------------------------------
 BASELINE_AREA_YEAR = 2014  # Baseline year for area extrapolation in predictions
+
+# ---------------------------------------------------------------------------
+# Parquet outputs (silver and gold)
+# ---------------------------------------------------------------------------
+PARQUET_COMPRESSION = "zstd"  # Tighter than snappy at similar read speed
+PARQUET_COMPRESSION_LEVEL = 3
+
+__all__ = (
+    "DRY_DAY_PRECIP_THRESHOLD_MM",
+    "MIN_DRY_SPELL_DAYS",
+    "FREEZE_THRESHOLD_KELVIN",
+    "HEAT_THRESHOLD_KELVIN",
+    "HEAVY_RAIN_THRESHOLD_MM",
+    "GROWING_SEASON_START_MONTH",
+    "GROWING_SEASON_END_MONTH",
+    "WINTER_START_MONTH",
+    "WINTER_MONTHS",
+    "VALIDATION_THRESHOLD_YEAR",
+    "SCENARIO_126",
+    "SCENARIO_245",
+    "SCENARIO_585",
+    "RANDOM_STATE",
+    "BASELINE_AREA_YEAR",
+    "PARQUET_COMPRESSION",
+    "PARQUET_COMPRESSION_LEVEL",
+)
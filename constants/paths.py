@@ -35,6 +35,7 @@ MODEL_DIR = PROJECT_ROOT / "models"
 APP_DIR = PROJECT_ROOT / "my_app"
 APP_DATA_DIR = APP_DIR / "data"
 APP_GEO_DIR = APP_DIR / "geo"
+APP_CACHE_DIR = APP_DATA_DIR / ".cache"  # Parquet snapshots of parsed inputs
 
 APP_HIST_PATH = APP_DATA_DIR / "barley_yield_from_1982.csv"
 APP_PRED_126_PATH = APP_DATA_DIR / "scenario_126_predictions.csv"
@@ -47,3 +48,31 @@ CONFIG_DIR = PROJECT_ROOT / "config"
 
 # Parameters file path
 PARAMS_FILE = PROJECT_ROOT / "params.yaml"
+
+__all__ = (
+    "PROJECT_ROOT",
+    "DATA_DIR",
+    "BRONZE_DIR",
+    "SILVER_DIR",
+    "GOLD_DIR",
+    "BARLEY_PATH",
+    "CLIMATE_PATH",
+    "SILVER_YIELD_PATH",
+    "SILVER_CLIMATE_PATH",
+    "GOLD_CLIMATE_PATH",
+    "GOLD_TRAINING_PATH",
+    "GOLD_VALIDATION_PATH",
+    "GOLD_SCENARIO_PATH",
+    "MODEL_DIR",
+    "APP_DIR",
+    "APP_DATA_DIR",
+    "APP_GEO_DIR",
+    "APP_CACHE_DIR",
+    "APP_HIST_PATH",
+    "APP_PRED_126_PATH",
+    "APP_PRED_245_PATH",
+    "APP_PRED_585_PATH",
+    "APP_GEOJSON_PATH",
+    "CONFIG_DIR",
+    "PARAMS_FILE",
+)
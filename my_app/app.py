@@ -1,16 +1,18 @@
-import json
+from functools import lru_cache
+import os
 from pathlib import Path
 import re
+import tempfile
 import unicodedata
 
 import numpy as np
 import pandas as pd
-import plotly.express as px
 import streamlit as st
 from theme import CHOROPLETH_SCALE, LINE_COLORS, SCENARIO_COLORS
 
 from constants.constants import BASELINE_AREA_YEAR
 from constants.paths import (
+    APP_CACHE_DIR,
     APP_GEOJSON_PATH,
     APP_HIST_PATH,
     APP_PRED_126_PATH,
@@ -29,7 +31,24 @@ MANUAL_FIXES = {
     "seine et oise": "yvelines",
 }
 
+_RE_PUNCT = re.compile(r"[-\u2018\u2019']")
+_RE_WS = re.compile(r"\s+")
+# Accented lowercase letters -> base letter (names are lowercased first)
+_ACCENT_TABLE = str.maketrans(
+    {
+        **dict.fromkeys("àáâãäå", "a"),
+        **dict.fromkeys("èéêë", "e"),
+        **dict.fromkeys("ìíîï", "i"),
+        **dict.fromkeys("òóôõö", "o"),
+        **dict.fromkeys("ùúûü", "u"),
+        **dict.fromkeys("ýÿ", "y"),
+        "ç": "c",
+        "ñ": "n",
+    }
+)
+
 
+@lru_cache(maxsize=512)
 def normalize_dep_name(s: str) -> str:
     """Normalize French department names to improve matching with GeoJSON."""
     if s is None:
@@ -40,13 +59,15 @@ def normalize_dep_name(s: str) -> str:
     s = s.replace("\u2019", "'")
     s = s.replace("_", " ")
 
-    # Remove accents
-    s = unicodedata.normalize("NFKD", s)
-    s = "".join(ch for ch in s if not unicodedata.combining(ch))
+    # Remove accents (table covers French names; NFKD only for anything else)
+    s = s.translate(_ACCENT_TABLE)
+    if not s.isascii():
+        s = unicodedata.normalize("NFKD", s)
+        s = "".join(ch for ch in s if not unicodedata.combining(ch))
 
     # Convert hyphens/apostrophes to spaces and squeeze
-    s = re.sub(r"[-\u2018\u2019']", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
+    s = _RE_PUNCT.sub(" ", s)
+    s = _RE_WS.sub(" ", s).strip()
 
     # Common abbreviations
     s = s.replace("saint ", "st ")
@@ -58,19 +79,19 @@ def normalize_dep_name(s: str) -> str:
 @st.cache_data
 def build_geo_name_map(geo: dict, geo_name_field: str) -> dict:
     """Dict: normalized_name -> exact GeoJSON name."""
-    m = {}
-    collisions = []
-    for feat in geo.get("features", []):
-        props = feat.get("properties", {})
-        name = props.get(geo_name_field)
-        if not isinstance(name, str):
-            continue
-        key = normalize_dep_name(name)
-        if key in m and m[key] != name:
-            collisions.append((key, m[key], name))
-        m[key] = name
-
-    if collisions:
+    names = [
+        feat.get("properties", {}).get(geo_name_field)
+        for feat in geo.get("features", [])
+    ]
+    names = [name for name in names if isinstance(name, str)]
+    m = {normalize_dep_name(name): name for name in names}
+
+    # Fewer keys than distinct names means some names collide
+    if len(m) < len(set(names)):
+        by_key = {}
+        for name in names:
+            by_key.setdefault(normalize_dep_name(name), set()).add(name)
+        collisions = [(k, *sorted(v)) for k, v in by_key.items() if len(v) > 1]
         st.warning(
             "Collisions in GeoJSON name normalization (showing first 5): "
             f"{collisions[:5]}"
@@ -81,41 +102,116 @@ def build_geo_name_map(geo: dict, geo_name_field: str) -> dict:
 def align_departments_to_geo(df: pd.DataFrame, geo_name_map: dict) -> pd.DataFrame:
     """Add a 'department_geo' column mapping department names to GeoJSON names."""
     out = df.copy()
-    out["dep_norm"] = out["department"].map(normalize_dep_name)
-    out["department_geo"] = out["dep_norm"].map(geo_name_map)
+    # Normalize each distinct name once, then broadcast to all rows
+    uniques = out["department"].unique()
+    dep_norm_map = {u: normalize_dep_name(u) for u in uniques}
+    out["dep_norm"] = out["department"].map(dep_norm_map).astype("category")
+    out["department_geo"] = out["dep_norm"].map(geo_name_map).astype("category")
     return out
 
 
 # -----------------------
 # Loaders (cached)
 # -----------------------
+# Snapshots are deterministic from the inputs and this script's parsing and
+# normalization code: reuse them while newer than both
+APP_SCRIPT_PATH = Path(__file__)
+
+
+def read_parquet_cache(cache_path: Path, *sources: Path) -> pd.DataFrame | None:
+    """Return the cached frame if it is newer than all its source files."""
+    if not cache_path.exists():
+        return None
+    if cache_path.stat().st_mtime <= max(p.stat().st_mtime for p in sources):
+        return None
+    try:
+        return pd.read_parquet(cache_path)
+    except Exception:
+        # Unreadable snapshot: rebuild it from the sources
+        return None
+
+
+def write_parquet_cache(df: pd.DataFrame, cache_path: Path) -> None:
+    """Persist a frame for the next cold start (skipped on read-only disks).
+
+    The snapshot is written to a temporary file and renamed into place, so
+    concurrent sessions never see a partially written file.
+    """
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=cache_path.parent, prefix=f".{cache_path.stem}.", suffix=".tmp"
+        )
+        os.close(fd)
+        try:
+            df.to_parquet(tmp_name, compression="snappy")
+            # mkstemp creates the file as 0600; keep it readable by other users
+            os.chmod(tmp_name, 0o644)
+            os.replace(tmp_name, cache_path)
+        finally:
+            if os.path.exists(tmp_name):
+                os.remove(tmp_name)
+    except OSError:
+        pass
+
+
+# Numeric columns are Arrow-backed float32: half the bytes per aggregation
+# (year is read as text and parsed leniently by `drop_invalid_years`)
+HIST_DTYPES = {
+    "department": "string",
+    "year": "string",
+    "yield": "float32[pyarrow]",
+    "area": "float32[pyarrow]",
+    "production": "float32[pyarrow]",
+}
+PRED_DTYPES = {
+    "nom_dep": "string",
+    "year": "string",
+    "predicted_yield": "float32[pyarrow]",
+}
+
+
+def drop_invalid_years(df: pd.DataFrame) -> pd.DataFrame:
+    """Parse `year` as int32, dropping rows where it is blank or not a number."""
+    year = pd.to_numeric(df["year"], errors="coerce")
+    df = df[year.notna()]
+    return df.assign(year=year[year.notna()].astype("int32[pyarrow]"))
+
+
 @st.cache_data
 def load_hist(path: Path) -> pd.DataFrame:
     """Load historical data, normalize columns, and ensure types."""
-    df = pd.read_csv(path, sep=";", engine="python")
-    if "Unnamed: 0" in df.columns:
-        df = df.drop(columns=["Unnamed: 0"])
+    cache_path = APP_CACHE_DIR / f"{path.stem}.parquet"
+    cached = read_parquet_cache(cache_path, path, APP_SCRIPT_PATH)
+    if cached is not None:
+        return cached
+
+    df = pd.read_csv(path, sep=";", engine="pyarrow", dtype=HIST_DTYPES)
+    # Leftover CSV index column (unnamed in the header)
+    df = df.drop(columns=["", "Unnamed: 0"], errors="ignore")
 
     required = {"department", "year", "yield", "area", "production"}
     missing = required - set(df.columns)
     if missing:
         raise ValueError(f"Historical file missing columns: {missing}")
 
-    df["department"] = df["department"].astype(str).str.strip()
-    df["year"] = pd.to_numeric(df["year"], errors="coerce").astype("Int64")
-    df["yield"] = pd.to_numeric(df["yield"], errors="coerce")
-    df["area"] = pd.to_numeric(df["area"], errors="coerce")
-    df["production"] = pd.to_numeric(df["production"], errors="coerce")
-
-    df = df.dropna(subset=["year"]).copy()
-    df["year"] = df["year"].astype(int)
+    df = drop_invalid_years(df)
+    df["department"] = df["department"].str.strip().astype("category")
+    # Sorted by year so that per-year selections are contiguous slices
+    df = df.sort_values("year", kind="stable", ignore_index=True)
+    write_parquet_cache(df, cache_path)
     return df
 
 
 @st.cache_data
 def load_pred(path: Path, scenario_name: str) -> pd.DataFrame:
     """Load prediction data, normalize columns, and ensure types."""
-    df = pd.read_csv(path)
+    cache_path = APP_CACHE_DIR / f"{path.stem}_{scenario_name}.parquet"
+    cached = read_parquet_cache(cache_path, path, APP_SCRIPT_PATH)
+    if cached is not None:
+        return cached
+
+    df = pd.read_csv(path, engine="pyarrow", dtype=PRED_DTYPES)
     df = df.rename(columns={"nom_dep": "department", "predicted_yield": "yield_pred"})
 
     required = {"department", "year", "yield_pred"}
@@ -123,19 +219,65 @@ def load_pred(path: Path, scenario_name: str) -> pd.DataFrame:
     if missing:
         raise ValueError(f"Prediction file {path.name} missing columns: {missing}")
 
-    df["department"] = df["department"].astype(str).str.strip()
-    df["year"] = pd.to_numeric(df["year"], errors="coerce").astype("Int64")
-    df["yield_pred"] = pd.to_numeric(df["yield_pred"], errors="coerce")
+    df = drop_invalid_years(df.dropna(subset=["department", "yield_pred"]))
+    df["department"] = df["department"].str.strip().astype("category")
+    df["scenario"] = pd.Categorical([scenario_name] * len(df))
+    df = df[["department", "year", "scenario", "yield_pred"]]
+    df = df.sort_values("year", kind="stable", ignore_index=True)
+    write_parquet_cache(df, cache_path)
+    return df
+
+
+PRED_PATHS = {
+    "scenario_585": APP_PRED_585_PATH,
+    "scenario_245": APP_PRED_245_PATH,
+    "scenario_126": APP_PRED_126_PATH,
+}
+
 
-    df = df.dropna(subset=["department", "year", "yield_pred"]).copy()
-    df["year"] = df["year"].astype(int)
-    df["scenario"] = scenario_name
-    return df[["department", "year", "scenario", "yield_pred"]]
+@st.cache_data(show_spinner=False)
+def get_hist(geo_name_map: dict) -> pd.DataFrame:
+    """Historical data aligned to GeoJSON names."""
+    cache_path = APP_CACHE_DIR / "hist_aligned.parquet"
+    hist = read_parquet_cache(
+        cache_path, APP_HIST_PATH, APP_GEOJSON_PATH, APP_SCRIPT_PATH
+    )
+    if hist is None:
+        hist = align_departments_to_geo(load_hist(APP_HIST_PATH), geo_name_map)
+        write_parquet_cache(hist, cache_path)
+    return hist
+
+
+@st.cache_data(show_spinner=False)
+def get_pred(scenario_name: str, geo_name_map: dict) -> pd.DataFrame:
+    """Predictions for one scenario aligned to GeoJSON names."""
+    path = PRED_PATHS[scenario_name]
+    cache_path = APP_CACHE_DIR / f"{path.stem}_aligned.parquet"
+    pred = read_parquet_cache(cache_path, path, APP_GEOJSON_PATH, APP_SCRIPT_PATH)
+    if pred is None:
+        pred = align_departments_to_geo(load_pred(path, scenario_name), geo_name_map)
+        write_parquet_cache(pred, cache_path)
+    return pred
+
+
+@st.cache_data(show_spinner=False)
+def get_pred_all(geo_name_map: dict, baseline_area: pd.DataFrame) -> pd.DataFrame:
+    """Predictions for all scenarios in one long frame, with baseline area."""
+    pred_all = pd.concat(
+        [get_pred(name, geo_name_map) for name in PRED_PATHS], ignore_index=True
+    )
+    # Category sets differ per file, so concat falls back to object
+    for col in ["department", "scenario", "dep_norm", "department_geo"]:
+        pred_all[col] = pred_all[col].astype("category")
+    attach_baseline_area(pred_all, baseline_area)
+    return pred_all
 
 
 @st.cache_data
 def load_geojson(path: Path) -> dict:
     """Load GeoJSON file and return as dict."""
+    import json
+
     with open(path, encoding="utf-8") as f:
         return json.load(f)
 
@@ -158,6 +300,8 @@ def infer_geo_name_field(geo: dict) -> str:
 # -----------------------
 def make_choropleth_map(df, geo, geo_name_field, value_col, title):
     """Make a choropleth map matching df to geojson by department name."""
+    import plotly.express as px
+
     featureidkey = f"properties.{geo_name_field}"
     fig = px.choropleth(
         df,
@@ -180,23 +324,91 @@ def make_choropleth_map(df, geo, geo_name_field, value_col, title):
     return fig
 
 
+def make_line_chart(df, x, y, title, **kwargs):
+    """Make a line chart (plotly is only imported once a chart is drawn)."""
+    import plotly.express as px
+
+    return px.line(df, x=x, y=y, title=title, **kwargs)
+
+
+def year_slice(df: pd.DataFrame, year: int) -> pd.DataFrame:
+    """Rows of `df` for `year`, found by binary search (`df` is sorted by year)."""
+    lo, hi = np.searchsorted(df["year"].to_numpy(), [year, year + 1])
+    return df.iloc[lo:hi]
+
+
+@st.cache_resource(show_spinner=False)
+def split_by_year(df: pd.DataFrame) -> dict[int, pd.DataFrame]:
+    """Per-year frames of `df`, shared across reruns (treat them as read-only)."""
+    return {
+        int(year): group.reset_index(drop=True)
+        for year, group in df.groupby("year", sort=False)
+    }
+
+
 def compute_baseline_area(hist: pd.DataFrame) -> pd.DataFrame:
     """Compute area by department at the baseline year."""
-    df = hist[hist["year"] == BASELINE_AREA_YEAR][["department", "area"]].copy()
+    df = year_slice(hist, BASELINE_AREA_YEAR)[["department", "area"]]
     df = df.dropna(subset=["area"]).drop_duplicates(subset=["department"])
     return df.rename(columns={"area": "area_baseline"})
 
 
-def apply_area_growth(
-    pred: pd.DataFrame, baseline_area: pd.DataFrame, growth_rate_pct: float
-) -> pd.DataFrame:
-    """Project area forward from baseline year using a constant annual growth rate."""
-    df = pred.merge(baseline_area, on="department", how="left", validate="m:1")
+def attach_baseline_area(pred: pd.DataFrame, baseline_area: pd.DataFrame) -> None:
+    """Add the baseline area and years since baseline to `pred`, in place.
+
+    Done once in the cached `get_pred_all` so that `apply_area_growth` needs no
+    merge.
+    """
+    deps = pred["department"].cat
+    area_by_dep = (
+        baseline_area.set_index("department")["area_baseline"]
+        .reindex(deps.categories)
+        .to_numpy(dtype=float)
+    )
+    pred["area_baseline"] = area_by_dep[deps.codes.to_numpy()]
+    pred["years_elapsed"] = (pred["year"] - BASELINE_AREA_YEAR).astype(np.int16)
+
+
+def apply_area_growth(pred: pd.DataFrame, growth_rate_pct: float) -> pd.DataFrame:
+    """Project area forward from baseline year using a constant annual growth rate.
+
+    `pred` must have been prepared with `attach_baseline_area`. Only the columns
+    the dashboard reads are returned, so `pred` itself is never copied.
+    """
     g = growth_rate_pct / 100.0
-    years_elapsed = (df["year"] - BASELINE_AREA_YEAR).astype(int)
-    df["area_adj"] = df["area_baseline"] * np.power(1.0 + g, years_elapsed)
-    df["production_pred"] = df["yield_pred"] * df["area_adj"]
-    return df
+    years_elapsed = pred["years_elapsed"].to_numpy()
+
+    # Few distinct years: evaluate the growth factor once per year, then gather
+    first = years_elapsed.min(initial=0)
+    last = years_elapsed.max(initial=0)
+    factors = np.power(1.0 + g, np.arange(first, last + 1))
+
+    area_adj = pred["area_baseline"].to_numpy() * factors[years_elapsed - first]
+    return pd.DataFrame(
+        {
+            "department": pred["department"],
+            "department_geo": pred["department_geo"],
+            "year": pred["year"],
+            "scenario": pred["scenario"],
+            "yield_pred": pred["yield_pred"],
+            "area_adj": area_adj,
+            "production_pred": pred["yield_pred"].to_numpy(dtype=float) * area_adj,
+        }
+    )
+
+
+@st.cache_data
+def compute_scenario_totals(pred: pd.DataFrame) -> pd.DataFrame:
+    """France production per scenario/year with zero area growth.
+
+    Growth applies the same factor to every department in a given year, so the
+    France total at any growth rate is this baseline scaled by (1 + g) ** years.
+    """
+    df = pred.assign(production_base=pred["yield_pred"] * pred["area_baseline"])
+    return df.groupby(["scenario", "year"], as_index=False, observed=True).agg(
+        production_base=("production_base", "sum"),
+        years_elapsed=("years_elapsed", "first"),
+    )
 
 
 # -----------------------
@@ -216,23 +428,14 @@ if missing_files:
     st.error("Missing required files:\n" + "\n".join(f"- {p}" for p in missing_files))
     st.stop()
 
-hist = load_hist(APP_HIST_PATH)
-pred_all = pd.concat(
-    [
-        load_pred(APP_PRED_585_PATH, "scenario_585"),
-        load_pred(APP_PRED_245_PATH, "scenario_245"),
-        load_pred(APP_PRED_126_PATH, "scenario_126"),
-    ],
-    ignore_index=True,
-)
-
 geo = load_geojson(APP_GEOJSON_PATH)
 geo_name_field = infer_geo_name_field(geo)
-
-# Build mapping and align names
 geo_name_map = build_geo_name_map(geo, geo_name_field)
-hist = align_departments_to_geo(hist, geo_name_map)
-pred_all = align_departments_to_geo(pred_all, geo_name_map)
+
+hist = get_hist(geo_name_map)
+baseline_area = compute_baseline_area(hist)
+hist_by_year = split_by_year(hist)
+pred_all = get_pred_all(geo_name_map, baseline_area)
 
 # Diagnostics: show what doesn't match
 missing_hist = sorted(hist.loc[hist["department_geo"].isna(), "department"].unique())
@@ -251,8 +454,6 @@ if missing_pred:
         f"(e.g. {missing_pred[:15]})"
     )
 
-baseline_area = compute_baseline_area(hist)
-
 missing_area_deps = sorted(
     set(pred_all["department"]) - set(baseline_area["department"])
 )
@@ -278,14 +479,12 @@ with tab_hist:
     min_y, max_y = int(hist["year"].min()), int(hist["year"].max())
     year = st.slider("Year", min_y, max_y, value=max_y, key="hist_year")
 
-    df_year = hist[hist["year"] == year][
-        ["department", "department_geo", "year", metric]
-    ].copy()
+    sub = hist_by_year.get(year, hist.iloc[:0])
+    df_year = sub[["department", "department_geo", "year", metric]]
     df_year = df_year.dropna(subset=[metric, "department_geo"])
 
     # KPIs
     col1, col2, col3 = st.columns(3)
-    sub = hist[hist["year"] == year]
 
     total_prod = sub["production"].sum(skipna=True)
     total_area = sub["area"].sum(skipna=True)
@@ -308,9 +507,10 @@ with tab_hist:
         st.plotly_chart(fig, use_container_width=True)
 
     with right:
-        dep = st.selectbox("Department (trend)", sorted(hist["department"].unique()))
+        # Categories are already sorted when the column is made categorical
+        dep = st.selectbox("Department (trend)", hist["department"].cat.categories)
         dep_ts = hist[hist["department"] == dep].sort_values("year")
-        fig2 = px.line(
+        fig2 = make_line_chart(
             dep_ts,
             x="year",
             y=metric,
@@ -325,13 +525,14 @@ with tab_hist:
 with tab_pred:
     st.subheader("Predicted values (scenarios)")
 
-    scenario = st.selectbox("Scenario", sorted(pred_all["scenario"].unique()))
+    scenario = st.selectbox("Scenario", sorted(PRED_PATHS))
     growth_rate = st.slider(
         "Area annual growth rate (%)", -10.0, 10.0, 0.0, 0.1, key="growth"
     )
 
-    df_sc = pred_all[pred_all["scenario"] == scenario].copy()
-    df_sc = apply_area_growth(df_sc, baseline_area, growth_rate_pct=growth_rate)
+    # Rows of one scenario keep their year order within pred_all
+    df_sc = pred_all[pred_all["scenario"] == scenario]
+    df_sc = apply_area_growth(df_sc, growth_rate_pct=growth_rate)
 
     metric_pred = st.selectbox(
         "Metric", ["yield_pred", "area_adj", "production_pred"], index=2
@@ -340,17 +541,7 @@ with tab_pred:
     min_py, max_py = int(df_sc["year"].min()), int(df_sc["year"].max())
     year = st.slider("Year", min_py, max_py, value=min_py, key="pred_year")
 
-    df_year = df_sc[df_sc["year"] == year][
-        [
-            "department",
-            "department_geo",
-            "year",
-            "scenario",
-            "yield_pred",
-            "area_adj",
-            "production_pred",
-        ]
-    ].copy()
+    df_year = year_slice(df_sc, year)
     df_year = df_year.dropna(subset=[metric_pred, "department_geo"])
 
     # KPIs
@@ -369,7 +560,7 @@ with tab_pred:
 
     with left:
         fig = make_choropleth_map(
-            df_year[["department", "department_geo", "year", metric_pred]].copy(),
+            df_year,
             geo,
             geo_name_field,
             metric_pred,
@@ -385,7 +576,7 @@ with tab_pred:
             production_pred=("production_pred", "sum"),
             area_adj=("area_adj", "sum"),
         )
-        fig2 = px.line(
+        fig2 = make_line_chart(
             trend,
             x="year",
             y="production_pred",
@@ -402,12 +593,13 @@ st.subheader("Scenario comparison (France totals)")
 
 growth_rate_safe = st.session_state.get("growth", 0.0)
 
-df_cmp = apply_area_growth(
-    pred_all.copy(), baseline_area, growth_rate_pct=growth_rate_safe
+scenario_totals = compute_scenario_totals(pred_all)
+cmp = scenario_totals.assign(
+    production_pred=scenario_totals["production_base"]
+    * np.power(1.0 + growth_rate_safe / 100.0, scenario_totals["years_elapsed"])
 )
-cmp = df_cmp.groupby(["scenario", "year"], as_index=False)["production_pred"].sum()
 
-fig3 = px.line(
+fig3 = make_line_chart(
     cmp,
     x="year",
     y="production_pred",
@@ -1,6 +1,12 @@
 """Bronze to Silver Pipeline."""
 
+import re
+import shutil
+
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pv
 
 from constants.column_names.bronze import (
     BRONZE_CLIMATE_CODE_DEP,
@@ -16,6 +22,8 @@ from constants.column_names.bronze import (
     BRONZE_YIELD_DEPARTMENT,
     BRONZE_YIELD_PRODUCTION,
     BRONZE_YIELD_UNNAMED_0,
+    BRONZE_YIELD_YEAR,
+    BRONZE_YIELD_YIELD,
     SCENARIO_HISTORICAL,
     SCENARIO_SSP2_4_5,
 )
@@ -30,6 +38,7 @@ from constants.column_names.silver import (
     SILVER_YEAR,
     SILVER_YIELD,
 )
+from constants.constants import PARQUET_COMPRESSION, PARQUET_COMPRESSION_LEVEL
 from constants.paths import (
     BARLEY_PATH,
     CLIMATE_PATH,
@@ -39,21 +48,38 @@ from constants.paths import (
 )
 from src.utils.logger import logger
 
+# Silver climate schema: single-precision metrics are plenty for daily values
+# in Kelvin / mm and halve the memory traffic of the gold aggregations
+SILVER_CLIMATE_SCHEMA = pa.schema(
+    [
+        (SILVER_SCENARIO, pa.string()),
+        (SILVER_NOM_DEP, pa.string()),
+        (SILVER_CODE_DEP, pa.dictionary(pa.int32(), pa.string())),
+        (SILVER_YEAR, pa.int16()),
+        (SILVER_TIME, pa.timestamp("ns")),
+        (SILVER_PRECIP, pa.float32()),
+        (SILVER_TEMP_MAX, pa.float32()),
+        (SILVER_TEMP_MEAN, pa.float32()),
+    ]
+)
+
 # ---------------------------------------------------------------------------
 # Helper
 # ---------------------------------------------------------------------------
 
 
+_RE_WS = re.compile(r"\s+")
+_RE_NON_ALNUM = re.compile(r"[^a-z0-9_]")
+
+
 def _clean_cols(df: pd.DataFrame) -> pd.DataFrame:
     """Lowercase, underscores, alphanumeric-only column names."""
-    df = df.copy()
-    df.columns = (
-        df.columns.astype(str)
-        .str.strip()
-        .str.lower()
-        .str.replace(r"\s+", "_", regex=True)
-        .str.replace(r"[^a-z0-9_]", "", regex=True)
-    )
+    # Shallow copy: only the column labels change, the data is shared
+    df = df.copy(deep=False)
+    df.columns = [
+        _RE_NON_ALNUM.sub("", _RE_WS.sub("_", str(col).strip().lower()))
+        for col in df.columns
+    ]
     return df
 
 
@@ -107,6 +133,13 @@ def clean_bronze_data(
 
     df_climate = _clean_cols(df_climate_raw)
     df_climate[SILVER_TIME] = pd.to_datetime(df_climate[BRONZE_CLIMATE_TIME])
+    df_climate[BRONZE_CLIMATE_SCENARIO] = df_climate[BRONZE_CLIMATE_SCENARIO].astype(
+        "category"
+    )
+    df_climate[SILVER_YEAR] = df_climate[SILVER_YEAR].astype(np.int16)
+    df_climate[BRONZE_CLIMATE_VALUE] = df_climate[BRONZE_CLIMATE_VALUE].astype(
+        np.float32
+    )
 
     # Reference sets from historical climate
     hist_mask = df_climate[BRONZE_CLIMATE_SCENARIO] == SCENARIO_HISTORICAL
@@ -117,20 +150,20 @@ def clean_bronze_data(
     n0 = len(df_yield)
 
     # 1. Recover yield = production / area
-    recoverable = (
-        df_yield[SILVER_YIELD].isna()
-        & df_yield[BRONZE_YIELD_AREA].notna()
-        & df_yield[BRONZE_YIELD_PRODUCTION].notna()
-        & (df_yield[BRONZE_YIELD_AREA] > 0)
-    )
-    df_yield.loc[recoverable, SILVER_YIELD] = (
-        df_yield.loc[recoverable, BRONZE_YIELD_PRODUCTION]
-        / df_yield.loc[recoverable, BRONZE_YIELD_AREA]
-    )
+    yield_values = df_yield[SILVER_YIELD].to_numpy(dtype=np.float64, copy=True)
+    area = df_yield[BRONZE_YIELD_AREA].to_numpy(dtype=np.float64)
+    production = df_yield[BRONZE_YIELD_PRODUCTION].to_numpy(dtype=np.float64)
+    recoverable = np.isnan(yield_values) & ~np.isnan(production) & (area > 0)
+    np.divide(production, area, out=yield_values, where=recoverable)
+    df_yield[SILVER_YIELD] = yield_values
     logger.info(f"Recovered {recoverable.sum()} yield values from production/area")
 
     # 2. Keep only departments present in climate
-    df_yield = df_yield[df_yield[SILVER_NOM_DEP].str.strip().isin(climate_depts)]
+    # (names are matched once per distinct value through the category codes;
+    # missing names have code -1, which hits the trailing False)
+    dep = df_yield[SILVER_NOM_DEP].astype("category")
+    known = dep.cat.categories.str.strip().isin(climate_depts)
+    df_yield = df_yield[np.append(known, False)[dep.cat.codes.to_numpy()]]
     logger.info(f"After dropping departments not in climate: {len(df_yield)} rows")
 
     # 3. Keep only years covered by historical climate (1982-2014)
@@ -155,22 +188,29 @@ def clean_bronze_data(
         BRONZE_METRIC_TEMP_MAX: SILVER_TEMP_MAX,
         BRONZE_METRIC_PRECIP: SILVER_PRECIP,
     }
-    df_climate[BRONZE_CLIMATE_METRIC] = df_climate[BRONZE_CLIMATE_METRIC].map(
-        metric_map
+    # (as categories: renaming touches the three labels, not every row)
+    df_climate[BRONZE_CLIMATE_METRIC] = (
+        df_climate[BRONZE_CLIMATE_METRIC]
+        .astype("category")
+        .cat.rename_categories(metric_map)
     )
 
-    # Pivot metrics into columns
-    climate_clean = df_climate.pivot_table(
-        index=[
-            BRONZE_CLIMATE_SCENARIO,
-            BRONZE_CLIMATE_NOM_DEP,
-            BRONZE_CLIMATE_CODE_DEP,
-            SILVER_YEAR,
-            SILVER_TIME,
-        ],
-        columns=BRONZE_CLIMATE_METRIC,
-        values=BRONZE_CLIMATE_VALUE,
-    ).reset_index()
+    # Pivot metrics into columns (one value per day and metric, so a plain
+    # unstack is enough, no aggregation needed)
+    climate_clean = (
+        df_climate.set_index(
+            [
+                BRONZE_CLIMATE_SCENARIO,
+                BRONZE_CLIMATE_NOM_DEP,
+                BRONZE_CLIMATE_CODE_DEP,
+                SILVER_YEAR,
+                SILVER_TIME,
+                BRONZE_CLIMATE_METRIC,
+            ]
+        )[BRONZE_CLIMATE_VALUE]
+        .unstack(BRONZE_CLIMATE_METRIC)
+        .reset_index()
+    )
     climate_clean.columns.name = None
 
     # Rename to silver column names
@@ -181,6 +221,12 @@ def clean_bronze_data(
             BRONZE_CLIMATE_CODE_DEP: SILVER_CODE_DEP,
         }
     )
+    # unstack keeps days whose metrics are all missing; pivot_table dropped them
+    climate_clean = climate_clean.dropna(
+        how="all", subset=[SILVER_TEMP_MEAN, SILVER_TEMP_MAX, SILVER_PRECIP]
+    )
+
+    climate_clean[SILVER_CODE_DEP] = climate_clean[SILVER_CODE_DEP].astype("category")
 
     # Clip negative precipitation
     climate_clean[SILVER_PRECIP] = climate_clean[SILVER_PRECIP].clip(lower=0)
@@ -211,7 +257,26 @@ def bronze_to_silver():
 
     # 1. Read bronze data
     logger.info(f"Reading yield data at {BARLEY_PATH}")
-    df_yield_raw = pd.read_csv(BARLEY_PATH, sep=";")
+    df_yield_raw = pv.read_csv(
+        BARLEY_PATH,
+        parse_options=pv.ParseOptions(delimiter=";"),
+        convert_options=pv.ConvertOptions(
+            # Skip the unnamed CSV index column
+            include_columns=[
+                BRONZE_YIELD_DEPARTMENT,
+                BRONZE_YIELD_YEAR,
+                BRONZE_YIELD_YIELD,
+                BRONZE_YIELD_AREA,
+                BRONZE_YIELD_PRODUCTION,
+            ],
+            column_types={
+                BRONZE_YIELD_YEAR: pa.int32(),
+                BRONZE_YIELD_YIELD: pa.float64(),
+                BRONZE_YIELD_AREA: pa.float64(),
+                BRONZE_YIELD_PRODUCTION: pa.float64(),
+            },
+        ),
+    ).to_pandas()
 
     logger.info(f"Reading climate data at {CLIMATE_PATH}")
     df_climate_raw = pd.read_parquet(CLIMATE_PATH)
@@ -222,10 +287,29 @@ def bronze_to_silver():
 
     # 3. Write silver
     logger.info(f"Writing yield silver to {SILVER_YIELD_PATH}")
-    yield_clean.to_parquet(SILVER_YIELD_PATH, index=False)
+    yield_clean.to_parquet(
+        SILVER_YIELD_PATH,
+        index=False,
+        compression=PARQUET_COMPRESSION,
+        compression_level=PARQUET_COMPRESSION_LEVEL,
+    )
 
+    # Climate silver is partitioned by scenario (one directory per scenario) so
+    # the gold pipeline only reads the scenario it is processing. Remove any
+    # previous output first, partitioned writes do not replace existing files.
     logger.info(f"Writing climate silver to {SILVER_CLIMATE_PATH}")
-    climate_clean.to_parquet(SILVER_CLIMATE_PATH, index=False)
+    if SILVER_CLIMATE_PATH.is_dir():
+        shutil.rmtree(SILVER_CLIMATE_PATH)
+    else:
+        SILVER_CLIMATE_PATH.unlink(missing_ok=True)
+    climate_clean.to_parquet(
+        SILVER_CLIMATE_PATH,
+        index=False,
+        schema=SILVER_CLIMATE_SCHEMA,
+        partition_cols=[SILVER_SCENARIO],
+        compression=PARQUET_COMPRESSION,
+        compression_level=PARQUET_COMPRESSION_LEVEL,
+    )
 
     logger.info("Bronze to Silver pipeline complete")
 
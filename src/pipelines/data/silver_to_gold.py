@@ -1,6 +1,15 @@
 """Silver to Gold Pipeline."""
 
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+import multiprocessing
+import os
+from pathlib import Path
+
+import numpy as np
 import pandas as pd
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
 
 from constants.column_names.bronze import SCENARIO_HISTORICAL
 from constants.column_names.gold import (
@@ -40,6 +49,8 @@ from constants.constants import (
     HEAT_THRESHOLD_KELVIN,
     HEAVY_RAIN_THRESHOLD_MM,
     MIN_DRY_SPELL_DAYS,
+    PARQUET_COMPRESSION,
+    PARQUET_COMPRESSION_LEVEL,
     VALIDATION_THRESHOLD_YEAR,
     WINTER_MONTHS,
     WINTER_START_MONTH,
@@ -55,16 +66,108 @@ from constants.paths import (
 )
 from src.utils.logger import logger
 
+# Silver climate columns read by the feature functions (code_dep is not needed)
+CLIMATE_FEATURE_INPUTS = [
+    SILVER_SCENARIO,
+    SILVER_NOM_DEP,
+    SILVER_YEAR,
+    SILVER_TIME,
+    SILVER_TEMP_MEAN,
+    SILVER_TEMP_MAX,
+    SILVER_PRECIP,
+]
+
+# Metric columns kept as arrays in ScenarioClimate
+CLIMATE_METRICS = (SILVER_TEMP_MEAN, SILVER_TEMP_MAX, SILVER_PRECIP)
+
+
+@dataclass(frozen=True)
+class ScenarioClimate:
+    """Daily climate of one scenario, as NumPy arrays shared by the features.
+
+    Rows are sorted by department then day. Departments are int32 codes into
+    ``dep_names`` (in name order, so sorting by code matches sorting by name).
+    Department/year pairs also get a dense group id,
+    ``dep * n_years + (year - first_year)``, usable directly as a bincount bin.
+
+    Attributes:
+        dep: Department code of each day.
+        year: Year of each day.
+        month: Month (1-12) of each day.
+        group: Department/year group id of each day.
+        groups: Sorted ids of the department/year groups present in the data.
+        metrics: Daily values per metric column (temp_mean, temp_max, precip).
+        dep_names: Department names indexed by code.
+        first_year: First year of the scenario.
+        n_years: Number of years spanned by the scenario.
+    """
+
+    dep: np.ndarray
+    year: np.ndarray
+    month: np.ndarray
+    group: np.ndarray
+    groups: np.ndarray
+    metrics: dict[str, np.ndarray]
+    dep_names: pd.Index
+    first_year: int
+    n_years: int
+
+    @property
+    def n_groups(self) -> int:
+        """Number of possible department/year group ids."""
+        return len(self.dep_names) * self.n_years
+
+    def group_keys(self, groups: np.ndarray) -> dict[str, np.ndarray]:
+        """Department code and year columns of the given group ids."""
+        return {
+            SILVER_NOM_DEP: (groups // self.n_years).astype(self.dep.dtype),
+            SILVER_YEAR: (self.first_year + groups % self.n_years).astype(
+                self.year.dtype
+            ),
+        }
+
+    @classmethod
+    def from_frame(cls, climate_data: pd.DataFrame) -> "ScenarioClimate":
+        """Sort, factorize and extract the arrays of a single-scenario frame.
+
+        Args:
+            climate_data: Silver climate data of a single scenario.
+
+        Returns:
+            The scenario climate arrays.
+        """
+        climate_data = climate_data.sort_values([SILVER_NOM_DEP, SILVER_TIME])
+        dep, dep_names = pd.factorize(climate_data[SILVER_NOM_DEP])
+        year = climate_data[SILVER_YEAR].to_numpy()
+        first_year = int(year.min())
+        n_years = int(year.max()) - first_year + 1
+        group = dep * n_years + (year - first_year)
+        # Rows are sorted by department then day, so group ids never decrease
+        # and each present group starts where the id changes
+        is_first = np.ones(len(group), dtype=bool)
+        is_first[1:] = group[1:] != group[:-1]
+        return cls(
+            dep=dep.astype(np.int32),
+            year=year,
+            month=climate_data[SILVER_TIME].dt.month.to_numpy().astype(np.int8),
+            group=group,
+            groups=group[is_first],
+            metrics={col: climate_data[col].to_numpy() for col in CLIMATE_METRICS},
+            dep_names=dep_names,
+            first_year=first_year,
+            n_years=n_years,
+        )
+
 
 def dry_periods(
-    climate_data: pd.DataFrame,
+    climate: ScenarioClimate,
     precip_col: str = SILVER_PRECIP,
     threshold: int = MIN_DRY_SPELL_DAYS,
 ) -> pd.DataFrame:
     """Count dry periods and max dry spell length per year.
 
     Args:
-        climate_data: Climate data.
+        climate: Climate arrays of a single scenario.
         precip_col: Name of the precipitation column.
         threshold: Minimum consecutive dry days to count as a dry period.
 
@@ -72,55 +175,45 @@ def dry_periods(
         DataFrame with number of dry periods and max dry spell length
         per department/year.
     """
-    df = climate_data[[SILVER_NOM_DEP, SILVER_YEAR, SILVER_TIME, precip_col]].copy()
-    df = df.sort_values([SILVER_NOM_DEP, SILVER_TIME])
-
-    # Dry day
-    df["is_dry"] = df[precip_col] < DRY_DAY_PRECIP_THRESHOLD_MM
-
-    # Consecutive dry day groups
-    df["dry_group"] = (
-        df["is_dry"] != df.groupby(SILVER_NOM_DEP)["is_dry"].shift()
-    ).cumsum()
-
-    # Count length of each dry period
-    dry_runs = (
-        df[df["is_dry"]]
-        .groupby([SILVER_NOM_DEP, SILVER_YEAR, "dry_group"])
-        .size()
-        .reset_index(name="run_length")
-    )
-
-    # Aggregate per department/year
-    result = (
-        dry_runs.groupby([SILVER_NOM_DEP, SILVER_YEAR])
-        .agg(
-            **{
-                GOLD_DRY_PERIODS_COUNT: (
-                    "run_length",
-                    lambda x: (x >= threshold).sum(),
-                ),
-                GOLD_MAX_DRY_SPELL_DAYS: ("run_length", "max"),
-            }
-        )
-        .reset_index()
-    )
-
-    # Years with no dry runs
-    all_dept_years = climate_data[[SILVER_NOM_DEP, SILVER_YEAR]].drop_duplicates()
-    result = all_dept_years.merge(result, on=[SILVER_NOM_DEP, SILVER_YEAR], how="left")
-    result[GOLD_DRY_PERIODS_COUNT] = (
-        result[GOLD_DRY_PERIODS_COUNT].fillna(0).astype(int)
-    )
-    result[GOLD_MAX_DRY_SPELL_DAYS] = (
-        result[GOLD_MAX_DRY_SPELL_DAYS].fillna(0).astype(int)
+    # Days are already in chronological order within each department
+    group = climate.group
+    is_dry = climate.metrics[precip_col] < DRY_DAY_PRECIP_THRESHOLD_MM
+
+    # Run-length encode dry/wet days: a run starts wherever the dry state or
+    # the department/year group changes (runs are counted per year)
+    is_start = np.ones(len(group), dtype=bool)
+    is_start[1:] = (is_dry[1:] != is_dry[:-1]) | (group[1:] != group[:-1])
+    starts = np.flatnonzero(is_start)
+    run_lengths = np.diff(np.append(starts, len(group)))
+
+    # Keep dry runs only
+    is_dry_run = is_dry[starts]
+    dry_groups = group[starts[is_dry_run]]
+    dry_lengths = run_lengths[is_dry_run]
+
+    # Count long dry runs and keep the longest one per department/year group
+    dry_periods_count = np.bincount(
+        dry_groups, weights=dry_lengths >= threshold, minlength=climate.n_groups
+    ).astype(np.int64)
+    max_dry_spell = np.zeros(climate.n_groups, dtype=np.int64)
+    np.maximum.at(max_dry_spell, dry_groups, dry_lengths)
+
+    # One row per department/year present in the data; years without any dry
+    # run already hold zeros in the bincount arrays
+    groups = climate.groups
+    result = pd.DataFrame(
+        {
+            **climate.group_keys(groups),
+            GOLD_DRY_PERIODS_COUNT: dry_periods_count[groups],
+            GOLD_MAX_DRY_SPELL_DAYS: max_dry_spell[groups],
+        }
     )
 
     return result
 
 
 def extreme_temperatures_and_rain(
-    climate_data: pd.DataFrame,
+    climate: ScenarioClimate,
     temp_col: str = SILVER_TEMP_MAX,
     precip_col: str = SILVER_PRECIP,
     freeze_threshold: float = FREEZE_THRESHOLD_KELVIN,
@@ -130,7 +223,7 @@ def extreme_temperatures_and_rain(
     """Count extreme temperature and rain days per year.
 
     Args:
-        climate_data: Climate data.
+        climate: Climate arrays of a single scenario.
         temp_col: Name of the temperature column.
         precip_col: Name of the precipitation column.
         freeze_threshold: Temperature below which is considered a freeze day (Kelvin).
@@ -140,34 +233,34 @@ def extreme_temperatures_and_rain(
     Returns:
         DataFrame with number of freeze, heat, and heavy rain days per department/year.
     """
-    df = climate_data[
-        [SILVER_NOM_DEP, SILVER_YEAR, SILVER_TIME, temp_col, precip_col]
-    ].copy()
-    df = df.sort_values([SILVER_NOM_DEP, SILVER_TIME])
-
-    # Extreme temperature days
-    df["is_freeze"] = df[temp_col] < freeze_threshold
-    df["is_heat"] = df[temp_col] > heat_threshold
-    df["is_heavy_rain"] = df[precip_col] > rain_threshold
-
-    # Extreme days per department/year
-    result = (
-        df.groupby([SILVER_NOM_DEP, SILVER_YEAR])
-        .agg(
+    temp = climate.metrics[temp_col]
+    precip = climate.metrics[precip_col]
+
+    # Extreme days per department/year group (NaN values never count)
+    group = climate.group
+    extreme_days = {
+        GOLD_FREEZE_DAYS_COUNT: temp < freeze_threshold,
+        GOLD_HEAT_DAYS_COUNT: temp > heat_threshold,
+        GOLD_HEAVY_RAIN_DAYS_COUNT: precip > rain_threshold,
+    }
+
+    # One row per department/year present in the data
+    groups = climate.groups
+    result = pd.DataFrame(
+        {
+            **climate.group_keys(groups),
             **{
-                GOLD_FREEZE_DAYS_COUNT: ("is_freeze", "sum"),
-                GOLD_HEAT_DAYS_COUNT: ("is_heat", "sum"),
-                GOLD_HEAVY_RAIN_DAYS_COUNT: ("is_heavy_rain", "sum"),
-            }
-        )
-        .reset_index()
+                col: np.bincount(group[is_extreme], minlength=climate.n_groups)[groups]
+                for col, is_extreme in extreme_days.items()
+            },
+        }
     )
 
     return result
 
 
 def precipitation_lag(
-    climate_data: pd.DataFrame,
+    climate: ScenarioClimate,
     precip_col: str = SILVER_PRECIP,
 ) -> pd.DataFrame:
     """Compute winter precipitation (Sep-Feb) preceding the growing season.
@@ -175,44 +268,41 @@ def precipitation_lag(
     This captures soil moisture reserves before the growing season starts in March.
 
     Args:
-        climate_data: Climate data (should be filtered to a single scenario).
+        climate: Climate arrays of a single scenario.
         precip_col: Name of the precipitation column.
 
     Returns:
         DataFrame with winter precipitation total per department/year.
     """
-    df = climate_data[[SILVER_NOM_DEP, SILVER_YEAR, SILVER_TIME, precip_col]].copy()
-    df["month"] = df[SILVER_TIME].dt.month
+    month = climate.month
 
     # Winter months: Sep-Dec of previous year + Jan-Feb of current year
     # Assign winter precip to the year of the growing season it precedes
-    df["growing_year"] = df.apply(
-        lambda row: (
-            row[SILVER_YEAR] + 1
-            if row["month"] >= WINTER_START_MONTH
-            else row[SILVER_YEAR]
-        ),
-        axis=1,
-    )
+    growing_year = climate.year + (month >= WINTER_START_MONTH).astype(np.int32)
 
     # Filter to winter months only (Sep, Oct, Nov, Dec, Jan, Feb)
-    winter_df = df[df["month"].isin(WINTER_MONTHS)]
+    # (month-indexed lookup table: one gather instead of a set-membership test)
+    winter_lut = np.zeros(13, dtype=bool)
+    winter_lut[WINTER_MONTHS] = True
+    is_winter = winter_lut[month]
+    winter_df = pd.DataFrame(
+        {
+            SILVER_NOM_DEP: climate.dep[is_winter],
+            SILVER_YEAR: growing_year[is_winter],
+            GOLD_WINTER_PRECIP_TOTAL: climate.metrics[precip_col][is_winter],
+        }
+    )
 
     # Sum winter precipitation per department/year
-    result = (
-        winter_df.groupby([SILVER_NOM_DEP, "growing_year"])[precip_col]
-        .sum()
-        .reset_index()
-        .rename(
-            columns={"growing_year": SILVER_YEAR, precip_col: GOLD_WINTER_PRECIP_TOTAL}
-        )
-    )
+    result = winter_df.groupby(
+        [SILVER_NOM_DEP, SILVER_YEAR], as_index=False, sort=False
+    )[GOLD_WINTER_PRECIP_TOTAL].sum()
 
     return result
 
 
 def seasonal_temperatures_and_rain(
-    climate_data: pd.DataFrame,
+    climate: ScenarioClimate,
     temp_col: str = SILVER_TEMP_MEAN,
     precip_col: str = SILVER_PRECIP,
 ) -> pd.DataFrame:
@@ -226,7 +316,7 @@ def seasonal_temperatures_and_rain(
     For precipitation, we compute total precipitation for both seasons.
 
     Args:
-        climate_data: Climate data.
+        climate: Climate arrays of a single scenario.
         temp_col: Name of the temperature column.
         precip_col: Name of the precipitation column.
 
@@ -234,75 +324,67 @@ def seasonal_temperatures_and_rain(
         DataFrame with seasonal temperature and precipitation features per
         department/year (one row per department/year, wide format).
     """
-    df = climate_data[
-        [SILVER_NOM_DEP, SILVER_YEAR, SILVER_TIME, temp_col, precip_col]
-    ].copy()
-    df = df.sort_values([SILVER_NOM_DEP, SILVER_TIME])
-
-    # Define seasons
-    df["month"] = df[SILVER_TIME].dt.month
-    df["season"] = df["month"].apply(
-        lambda x: (
-            "growing"
-            if GROWING_SEASON_START_MONTH <= x <= GROWING_SEASON_END_MONTH
-            else "non_growing"
-        )
-    )
-
-    # Seasonal temperature features
-    temp_features = (
-        df.groupby([SILVER_NOM_DEP, SILVER_YEAR, "season"])[temp_col]
-        .agg(["mean", "min", "max", "std"])
-        .reset_index()
-    )
-    temp_features.columns = [
-        SILVER_NOM_DEP,
-        SILVER_YEAR,
-        "season",
-        "temp_mean",
-        "temp_min",
-        "temp_max",
-        "temp_std",
-    ]
-
-    # Seasonal precipitation features
-    precip_features = (
-        df.groupby([SILVER_NOM_DEP, SILVER_YEAR, "season"])[precip_col]
-        .sum()
-        .reset_index()
-    )
-    precip_features.columns = [SILVER_NOM_DEP, SILVER_YEAR, "season", "total_precip"]
-
-    # Merge temperature and precipitation features
-    result = pd.merge(
-        temp_features, precip_features, on=[SILVER_NOM_DEP, SILVER_YEAR, "season"]
+    # One output cell per department/year group and season:
+    # cell = 2 * group + season, with season 0 = growing and 1 = non-growing
+    month = climate.month
+    is_growing = (month >= GROWING_SEASON_START_MONTH) & (
+        month <= GROWING_SEASON_END_MONTH
     )
+    cells = 2 * climate.group + ~is_growing
+    n_cells = 2 * climate.n_groups
+
+    # Temperature statistics over non-missing values (as pandas would)
+    temp = climate.metrics[temp_col].astype(np.float64)
+    has_temp = ~np.isnan(temp)
+    temp_cells, temp = cells[has_temp], temp[has_temp]
+    n_temp = np.bincount(temp_cells, minlength=n_cells)
+    temp_min = np.full(n_cells, np.inf)
+    np.minimum.at(temp_min, temp_cells, temp)
+    temp_max = np.full(n_cells, -np.inf)
+    np.maximum.at(temp_max, temp_cells, temp)
+    # Single-pass (sample) variance from sums of values shifted by the freezing
+    # point: the shift keeps sums small next to Kelvin-scale values, so the
+    # sum-of-squares formula does not lose precision to cancellation
+    shifted = temp - FREEZE_THRESHOLD_KELVIN
+    sum_temp = np.bincount(temp_cells, weights=shifted, minlength=n_cells)
+    sum_sq_temp = np.bincount(temp_cells, weights=shifted**2, minlength=n_cells)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        temp_mean = FREEZE_THRESHOLD_KELVIN + sum_temp / n_temp
+        temp_var = (sum_sq_temp - sum_temp * sum_temp / n_temp) / (n_temp - 1)
+        temp_std = np.sqrt(np.maximum(temp_var, 0))
+    temp_min[n_temp == 0] = np.nan
+    temp_max[n_temp == 0] = np.nan
+    temp_std[n_temp < 2] = np.nan
+
+    # Precipitation totals (missing values count as 0, seasons without any
+    # day are missing)
+    precip = np.nan_to_num(climate.metrics[precip_col].astype(np.float64))
+    total_precip = np.bincount(cells, weights=precip, minlength=n_cells)
+    n_days = np.bincount(cells, minlength=n_cells)
+    total_precip[n_days == 0] = np.nan
+
+    # Wide format, one row per department/year present in the data, in the
+    # input precision
+    groups = climate.groups
+    temp_dtype = climate.metrics[temp_col].dtype
+    features = {
+        (GOLD_TEMP_MAX_GROWING, GOLD_TEMP_MAX_NON_GROWING): temp_max.astype(temp_dtype),
+        (GOLD_TEMP_MEAN_GROWING, GOLD_TEMP_MEAN_NON_GROWING): temp_mean.astype(
+            temp_dtype
+        ),
+        (GOLD_TEMP_MIN_GROWING, GOLD_TEMP_MIN_NON_GROWING): temp_min.astype(temp_dtype),
+        (GOLD_TEMP_STD_GROWING, GOLD_TEMP_STD_NON_GROWING): temp_std.astype(temp_dtype),
+        (GOLD_TOTAL_PRECIP_GROWING, GOLD_TOTAL_PRECIP_NON_GROWING): (
+            total_precip.astype(climate.metrics[precip_col].dtype)
+        ),
+    }
+    wide = climate.group_keys(groups)
+    for (growing_col, non_growing_col), values in features.items():
+        values = values.reshape(-1, 2)[groups]
+        wide[growing_col] = values[:, 0]
+        wide[non_growing_col] = values[:, 1]
 
-    # Pivot to wide format (one row per department/year)
-    result = result.pivot_table(
-        index=[SILVER_NOM_DEP, SILVER_YEAR],
-        columns="season",
-        values=["temp_mean", "temp_min", "temp_max", "temp_std", "total_precip"],
-    ).reset_index()
-
-    # Flatten column names and rename to gold constants
-    result.columns = [
-        f"{col[0]}_{col[1]}" if col[1] else col[0] for col in result.columns
-    ]
-    result = result.rename(
-        columns={
-            "temp_mean_growing": GOLD_TEMP_MEAN_GROWING,
-            "temp_mean_non_growing": GOLD_TEMP_MEAN_NON_GROWING,
-            "temp_min_growing": GOLD_TEMP_MIN_GROWING,
-            "temp_min_non_growing": GOLD_TEMP_MIN_NON_GROWING,
-            "temp_max_growing": GOLD_TEMP_MAX_GROWING,
-            "temp_max_non_growing": GOLD_TEMP_MAX_NON_GROWING,
-            "temp_std_growing": GOLD_TEMP_STD_GROWING,
-            "temp_std_non_growing": GOLD_TEMP_STD_NON_GROWING,
-            "total_precip_growing": GOLD_TOTAL_PRECIP_GROWING,
-            "total_precip_non_growing": GOLD_TOTAL_PRECIP_NON_GROWING,
-        }
-    )
+    result = pd.DataFrame(wide)
 
     return result
 
@@ -359,6 +441,69 @@ def create_gold_datasets(
     return training_data, validation_data, future_climate
 
 
+def _compute_scenario_features(climate_path: Path, scenario: str) -> pd.DataFrame:
+    """Compute all climate features for one scenario.
+
+    Args:
+        climate_path: Path to the scenario-partitioned silver climate dataset.
+        scenario: Scenario to process.
+
+    Returns:
+        DataFrame with one row per department/year and all climate features.
+    """
+    logger.info(f"Computing features for scenario: {scenario}")
+    # Only this scenario's partition is read
+    scenario_data = (
+        ds.dataset(climate_path, format="parquet", partitioning="hive")
+        .to_table(
+            columns=CLIMATE_FEATURE_INPUTS,
+            filter=pc.field(SILVER_SCENARIO) == scenario,
+        )
+        .to_pandas()
+    )
+
+    # Sort once and group on integer department codes rather than names; the
+    # names are restored once the scenario features are merged
+    climate = ScenarioClimate.from_frame(scenario_data)
+
+    # Compute features for this scenario
+    dry_periods_df = dry_periods(climate, precip_col=SILVER_PRECIP)
+    extreme_events_df = extreme_temperatures_and_rain(
+        climate,
+        temp_col=SILVER_TEMP_MAX,
+        precip_col=SILVER_PRECIP,
+    )
+    precip_lag_df = precipitation_lag(climate, precip_col=SILVER_PRECIP)
+    seasonal_features_df = seasonal_temperatures_and_rain(
+        climate, temp_col=SILVER_TEMP_MEAN, precip_col=SILVER_PRECIP
+    )
+
+    # Align all features on the scenario's department/year pairs in one pass
+    keys = [SILVER_NOM_DEP, SILVER_YEAR]
+    dept_years = pd.MultiIndex.from_frame(
+        pd.DataFrame(climate.group_keys(climate.groups))
+    )
+    scenario_clean = pd.concat(
+        [
+            df.set_index(keys).reindex(dept_years)
+            for df in (
+                dry_periods_df,
+                extreme_events_df,
+                seasonal_features_df,
+                precip_lag_df,
+            )
+        ],
+        axis=1,
+    ).reset_index()
+    scenario_clean.insert(2, SILVER_SCENARIO, scenario)
+
+    scenario_clean[SILVER_NOM_DEP] = climate.dep_names.take(
+        scenario_clean[SILVER_NOM_DEP]
+    )
+
+    return scenario_clean
+
+
 def silver_to_gold():
     """Pipeline to transform silver data to gold data.
 
@@ -386,42 +531,26 @@ def silver_to_gold():
     df_yield = pd.read_parquet(SILVER_YIELD_PATH)
 
     logger.info(f"Reading climate silver data at {SILVER_CLIMATE_PATH}")
-    df_climate = pd.read_parquet(SILVER_CLIMATE_PATH)
+    climate_ds = ds.dataset(SILVER_CLIMATE_PATH, format="parquet", partitioning="hive")
+    scenarios = pc.unique(climate_ds.to_table(columns=[SILVER_SCENARIO])[0]).to_pylist()
 
-    # 2. Process data - compute features separately for each scenario
+    # 2. Process data - scenarios are independent, compute their features in
+    # parallel (each worker reads only its own partition). Workers are spawned
+    # rather than forked: pyarrow's thread pool is already running here, and
+    # forking a multi-threaded process can deadlock.
     logger.info("Processing climate data")
-
-    scenario_features = []
-    for scenario in df_climate[SILVER_SCENARIO].unique():
-        logger.info(f"Computing features for scenario: {scenario}")
-        scenario_data = df_climate[df_climate[SILVER_SCENARIO] == scenario]
-
-        # Compute features for this scenario
-        dry_periods_df = dry_periods(scenario_data, precip_col=SILVER_PRECIP)
-        extreme_events_df = extreme_temperatures_and_rain(
-            scenario_data,
-            temp_col=SILVER_TEMP_MAX,
-            precip_col=SILVER_PRECIP,
-        )
-        precip_lag_df = precipitation_lag(scenario_data, precip_col=SILVER_PRECIP)
-        seasonal_features_df = seasonal_temperatures_and_rain(
-            scenario_data, temp_col=SILVER_TEMP_MEAN, precip_col=SILVER_PRECIP
-        )
-
-        # Merge all features for this scenario
-        scenario_clean = scenario_data[[SILVER_NOM_DEP, SILVER_YEAR]].drop_duplicates()
-        scenario_clean[SILVER_SCENARIO] = scenario
-        for df in [dry_periods_df, extreme_events_df, seasonal_features_df]:
-            scenario_clean = scenario_clean.merge(
-                df, on=[SILVER_NOM_DEP, SILVER_YEAR], how="left"
+    with ProcessPoolExecutor(
+        max_workers=min(len(scenarios), os.cpu_count() or 1),
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as pool:
+        scenario_features = list(
+            pool.map(
+                _compute_scenario_features,
+                [SILVER_CLIMATE_PATH] * len(scenarios),
+                scenarios,
             )
-
-        scenario_clean = scenario_clean.merge(
-            precip_lag_df, on=[SILVER_NOM_DEP, SILVER_YEAR], how="left"
         )
 
-        scenario_features.append(scenario_clean)
-
     # Concatenate all scenarios
     climate_clean = pd.concat(scenario_features, ignore_index=True)
 
@@ -435,16 +564,36 @@ def silver_to_gold():
     GOLD_DIR.mkdir(parents=True, exist_ok=True)
 
     logger.info(f"Writing processed climate data to {GOLD_CLIMATE_PATH}")
-    climate_clean.to_parquet(GOLD_CLIMATE_PATH, index=False)
+    climate_clean.to_parquet(
+        GOLD_CLIMATE_PATH,
+        index=False,
+        compression=PARQUET_COMPRESSION,
+        compression_level=PARQUET_COMPRESSION_LEVEL,
+    )
 
     logger.info(f"Writing training data to {GOLD_TRAINING_PATH}")
-    training_data.to_parquet(GOLD_TRAINING_PATH, index=False)
+    training_data.to_parquet(
+        GOLD_TRAINING_PATH,
+        index=False,
+        compression=PARQUET_COMPRESSION,
+        compression_level=PARQUET_COMPRESSION_LEVEL,
+    )
 
     logger.info(f"Writing validation data to {GOLD_VALIDATION_PATH}")
-    validation_data.to_parquet(GOLD_VALIDATION_PATH, index=False)
+    validation_data.to_parquet(
+        GOLD_VALIDATION_PATH,
+        index=False,
+        compression=PARQUET_COMPRESSION,
+        compression_level=PARQUET_COMPRESSION_LEVEL,
+    )
 
     logger.info(f"Writing scenario data to {GOLD_SCENARIO_PATH}")
-    scenario_data.to_parquet(GOLD_SCENARIO_PATH, index=False)
+    scenario_data.to_parquet(
+        GOLD_SCENARIO_PATH,
+        index=False,
+        compression=PARQUET_COMPRESSION,
+        compression_level=PARQUET_COMPRESSION_LEVEL,
+    )
 
 
 if __name__ == "__main__":
@@ -1,10 +1,10 @@
 """Pipeline to train models."""
 
 import pandas as pd
-from sklearn.preprocessing import LabelEncoder
 
 from src.pipelines.models.xgboost_model import train_xgboost_model
 from src.pipelines.utils.model_inputs_loading import (
+    DepartmentEncoder,
     load_params,
     load_training_data,
 )
@@ -18,7 +18,7 @@ def train_and_predict(
     y_train: pd.Series,
     X_test: pd.DataFrame,
     y_test: pd.Series,
-    dep_encoder: LabelEncoder,
+    dep_encoder: DepartmentEncoder,
 ):
     """Train a single model, and make predictions.
 
@@ -29,7 +29,7 @@ def train_and_predict(
         y_train (pd.Series): Training target vector.
         X_test (pd.DataFrame): Testing feature matrix.
         y_test (pd.Series): Testing target vector.
-        dep_encoder (LabelEncoder): Fitted encoder for nom_dep.
+        dep_encoder (DepartmentEncoder): Fitted encoder for nom_dep.
     """
     run_name = f"{experiment_name}_{model_type}_run"
     model_name = f"{experiment_name}_{model_type}_model"
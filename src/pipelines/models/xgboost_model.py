@@ -15,15 +15,21 @@ from sklearn.metrics import (
     r2_score,
     root_mean_squared_error,
 )
-from sklearn.preprocessing import LabelEncoder
 from xgboost import XGBRegressor
 
 from constants.constants import RANDOM_STATE
 import constants.paths as pth
+from src.pipelines.utils.model_inputs_loading import (
+    SIGNATURE_DTYPES,
+    DepartmentEncoder,
+)
 from src.pipelines.utils.prediction_utils import (
     prediction_pipeline,
 )
 
+# Number of training rows used to infer the MLflow model signature
+SIGNATURE_SAMPLE_SIZE = 100
+
 
 # Model Training and Logging Function
 def train_xgboost_model(
@@ -33,7 +39,7 @@ def train_xgboost_model(
     y_train: pd.Series,
     X_test: pd.DataFrame,
     y_test: pd.Series,
-    dep_encoder: LabelEncoder,
+    dep_encoder: DepartmentEncoder,
     **kwargs,
 ):
     """Train and log an XGBoost model using MLflow. Predict on future data.
@@ -48,7 +54,7 @@ def train_xgboost_model(
         y_train (pd.Series): Training target vector.
         X_test (pd.DataFrame): Testing feature matrix.
         y_test (pd.Series): Testing target vector.
-        dep_encoder (LabelEncoder): Fitted encoder for nom_dep.
+        dep_encoder (DepartmentEncoder): Fitted encoder for nom_dep.
         **kwargs: Additional keyword arguments for XGBRegressor.
     """
     # Load environment variables for MLflow configuration
@@ -82,8 +88,15 @@ def train_xgboost_model(
         mlflow.log_metric("r2", r2)
         mlflow.log_metric("std", std)
 
-        # Log model
-        signature = infer_signature(X_train, model.predict(X_train))
+        # Log model (the signature only needs column names and dtypes,
+        # so a small sample is enough). The sample is cast back to the gold
+        # long/double dtypes so the logged schema does not depend on the
+        # float32 downcast done at load time.
+        signature_sample = X_train.head(SIGNATURE_SAMPLE_SIZE)
+        signature = infer_signature(
+            signature_sample.astype(SIGNATURE_DTYPES),
+            model.predict(signature_sample),
+        )
         mlflow.xgboost.log_model(
             model,
             name=model_name,
@@ -99,9 +112,12 @@ def train_xgboost_model(
         artifacts_dir = model_dir / "artifacts"
         artifacts_dir.mkdir(parents=True, exist_ok=True)
 
-        # Retrain on full dataset (train + test)
-        full_X = pd.concat([X_train, X_test], axis=0)
-        full_y = pd.concat([y_train, y_test], axis=0)
+        # Retrain on full dataset (train + test), stacked as float32 arrays
+        # (the refitted model is only used through inplace_predict on arrays)
+        full_X = np.concatenate(
+            [X_train.to_numpy(dtype=np.float32), X_test.to_numpy(dtype=np.float32)]
+        )
+        full_y = np.concatenate([y_train.to_numpy(), y_test.to_numpy()])
         model.fit(full_X, full_y)
 
         # Predict on all three scenarii
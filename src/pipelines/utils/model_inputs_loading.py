@@ -1,13 +1,92 @@
 """Utilities for loading model inputs."""
 
+import numpy as np
 import pandas as pd
-from sklearn.preprocessing import LabelEncoder
 import yaml
 
-from constants.column_names.gold import GOLD_NOM_DEP, GOLD_YEAR, GOLD_YIELD
+from constants.column_names.gold import (
+    GOLD_DRY_PERIODS_COUNT,
+    GOLD_FEATURE_COLUMNS,
+    GOLD_FREEZE_DAYS_COUNT,
+    GOLD_HEAT_DAYS_COUNT,
+    GOLD_HEAVY_RAIN_DAYS_COUNT,
+    GOLD_MAX_DRY_SPELL_DAYS,
+    GOLD_NOM_DEP,
+    GOLD_YIELD,
+)
 from constants.paths import GOLD_TRAINING_PATH, GOLD_VALIDATION_PATH, PARAMS_FILE
 
 TARGET_COLUMN = GOLD_YIELD
+FEATURE_COLUMNS = list(GOLD_FEATURE_COLUMNS)
+
+# Feature dtypes of the model contract (logged MLflow signature): encoded
+# nom_dep and day counts are long, everything else double. The float32/int32
+# frames returned by load_training_data are an in-memory optimisation only.
+INTEGER_FEATURE_COLUMNS = (
+    GOLD_NOM_DEP,
+    GOLD_DRY_PERIODS_COUNT,
+    GOLD_MAX_DRY_SPELL_DAYS,
+    GOLD_FREEZE_DAYS_COUNT,
+    GOLD_HEAT_DAYS_COUNT,
+    GOLD_HEAVY_RAIN_DAYS_COUNT,
+)
+SIGNATURE_DTYPES = {
+    col: np.int64 if col in INTEGER_FEATURE_COLUMNS else np.float64
+    for col in FEATURE_COLUMNS
+}
+
+
+class DepartmentEncoder:
+    """Dictionary-backed replacement for ``LabelEncoder`` on department names.
+
+    Codes follow the sorted order of the names, as with ``LabelEncoder``, but
+    encoding is a single hash lookup per row instead of a sorted search.
+
+    Attributes:
+        classes_ (np.ndarray): Sorted department names; the position is the code.
+    """
+
+    def fit(self, values: pd.Series) -> "DepartmentEncoder":
+        """Learn the sorted department names and their codes.
+
+        Args:
+            values (pd.Series): Department names.
+
+        Returns:
+            DepartmentEncoder: The fitted encoder.
+        """
+        self.classes_ = np.unique(values.to_numpy())
+        self._mapping = {name: code for code, name in enumerate(self.classes_)}
+        return self
+
+    def transform(self, values: pd.Series) -> np.ndarray:
+        """Encode department names as int32 codes.
+
+        Args:
+            values (pd.Series): Department names seen during fit.
+
+        Returns:
+            np.ndarray: The int32 code of each name.
+
+        Raises:
+            ValueError: If a name was not seen during fit.
+        """
+        codes = values.map(self._mapping)
+        if codes.isna().any():
+            unknown = values[codes.isna()].unique().tolist()
+            raise ValueError(f"Unknown departments: {unknown}")
+        return codes.to_numpy(dtype=np.int32)
+
+    def inverse_transform(self, codes: pd.Series | np.ndarray) -> np.ndarray:
+        """Decode int codes back to department names.
+
+        Args:
+            codes (pd.Series | np.ndarray): Codes returned by ``transform``.
+
+        Returns:
+            np.ndarray: The department name of each code.
+        """
+        return self.classes_[np.asarray(codes)]
 
 
 def load_params() -> dict:
@@ -29,27 +108,33 @@ def load_training_data():
             - y_train (pd.Series): Training target vector.
             - X_test (pd.DataFrame): Testing feature matrix.
             - y_test (pd.Series): Testing target vector.
-            - dep_encoder (LabelEncoder): Fitted encoder for nom_dep.
+            - dep_encoder (DepartmentEncoder): Fitted encoder for nom_dep.
     """
-    # Load gold datasets
-    train_data = pd.read_parquet(GOLD_TRAINING_PATH)
-    test_data = pd.read_parquet(GOLD_VALIDATION_PATH)
+    # Load gold datasets (model features and target only; nom_dep stays
+    # dictionary-encoded, so encoding maps categories rather than rows)
+    columns = [*FEATURE_COLUMNS, TARGET_COLUMN]
+    train_data = pd.read_parquet(
+        GOLD_TRAINING_PATH, columns=columns, read_dictionary=[GOLD_NOM_DEP]
+    )
+    test_data = pd.read_parquet(
+        GOLD_VALIDATION_PATH, columns=columns, read_dictionary=[GOLD_NOM_DEP]
+    )
 
     # Fit label encoder on all department names
     all_deps = pd.concat([train_data[GOLD_NOM_DEP], test_data[GOLD_NOM_DEP]])
-    dep_encoder = LabelEncoder()
-    dep_encoder.fit(all_deps)
+    dep_encoder = DepartmentEncoder().fit(all_deps)
 
     # Encode nom_dep
     train_data[GOLD_NOM_DEP] = dep_encoder.transform(train_data[GOLD_NOM_DEP])
     test_data[GOLD_NOM_DEP] = dep_encoder.transform(test_data[GOLD_NOM_DEP])
 
-    # Split into features and target
-    drop_cols = [TARGET_COLUMN, GOLD_YEAR]
-    X_train = train_data.drop(columns=drop_cols)
+    # Split into features and target; numeric features are downcast to float32,
+    # the precision XGBoost trains in (nom_dep keeps its int32 codes)
+    feature_dtypes = {col: np.float32 for col in FEATURE_COLUMNS if col != GOLD_NOM_DEP}
+    X_train = train_data[FEATURE_COLUMNS].astype(feature_dtypes)
     y_train = train_data[TARGET_COLUMN]
 
-    X_test = test_data.drop(columns=drop_cols)
+    X_test = test_data[FEATURE_COLUMNS].astype(feature_dtypes)
     y_test = test_data[TARGET_COLUMN]
 
     return X_train, y_train, X_test, y_test, dep_encoder
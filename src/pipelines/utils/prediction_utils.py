@@ -1,21 +1,31 @@
 """Prediction utilities."""
 
+import numpy as np
 import pandas as pd
-from sklearn.preprocessing import LabelEncoder
 
 from constants.column_names.dashboard import DASHBOARD_COLUMNS, DASHBOARD_YIELD
-from constants.column_names.gold import GOLD_NOM_DEP, GOLD_SCENARIO, GOLD_YEAR
+from constants.column_names.gold import (
+    GOLD_FEATURE_COLUMNS,
+    GOLD_NOM_DEP,
+    GOLD_SCENARIO,
+    GOLD_YEAR,
+)
 from constants.constants import SCENARIO_126, SCENARIO_245, SCENARIO_585
 import constants.paths as pth
+from src.pipelines.utils.model_inputs_loading import DepartmentEncoder
+
+# Predicted yields are written with 4 decimals (t/ha); the dashboard reads them
+# back as float32, so more digits only cost formatting time and file size
+PREDICTION_FLOAT_FORMAT = "%.4f"
 
 
 def prepare_prediction_data(
-    dep_encoder: LabelEncoder,
+    dep_encoder: DepartmentEncoder,
 ) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     """Prepare the data for prediction on future scenarios.
 
     Args:
-        dep_encoder (LabelEncoder): Fitted encoder for nom_dep.
+        dep_encoder (DepartmentEncoder): Fitted encoder for nom_dep.
 
     Returns:
         tuple: A tuple containing the prepared data for the three scenarios:
@@ -23,20 +33,22 @@ def prepare_prediction_data(
             - scenario_2 (pd.DataFrame): Prepared data for scenario 2.
             - scenario_3 (pd.DataFrame): Prepared data for scenario 3.
     """
-    scenarii = pd.read_parquet(pth.GOLD_SCENARIO_PATH)
-    scenario_1 = scenarii[scenarii[GOLD_SCENARIO] == SCENARIO_126].drop(
-        columns=[GOLD_SCENARIO]
-    )
-    scenario_2 = scenarii[scenarii[GOLD_SCENARIO] == SCENARIO_245].drop(
-        columns=[GOLD_SCENARIO]
-    )
-    scenario_3 = scenarii[scenarii[GOLD_SCENARIO] == SCENARIO_585].drop(
-        columns=[GOLD_SCENARIO]
+    scenarii = pd.read_parquet(
+        pth.GOLD_SCENARIO_PATH,
+        columns=[*GOLD_FEATURE_COLUMNS, GOLD_YEAR, GOLD_SCENARIO],
+        read_dictionary=[GOLD_NOM_DEP, GOLD_SCENARIO],
     )
 
-    # Encode nom_dep for model input
-    for df in [scenario_1, scenario_2, scenario_3]:
-        df[GOLD_NOM_DEP] = dep_encoder.transform(df[GOLD_NOM_DEP])
+    # Encode nom_dep for model input (once, before splitting by scenario)
+    scenarii[GOLD_NOM_DEP] = dep_encoder.transform(scenarii[GOLD_NOM_DEP])
+
+    # Split by scenario in a single grouping pass
+    by_scenario = scenarii.drop(columns=[GOLD_SCENARIO]).groupby(
+        scenarii[GOLD_SCENARIO], sort=False, observed=True
+    )
+    scenario_1 = by_scenario.get_group(SCENARIO_126)
+    scenario_2 = by_scenario.get_group(SCENARIO_245)
+    scenario_3 = by_scenario.get_group(SCENARIO_585)
 
     return scenario_1, scenario_2, scenario_3
 
@@ -44,7 +56,7 @@ def prepare_prediction_data(
 def prepare_dashboard_data(
     scenario_data: pd.DataFrame,
     predictions: pd.Series,
-    dep_encoder: LabelEncoder,
+    dep_encoder: DepartmentEncoder,
 ) -> pd.DataFrame:
     """Prepare the data for dashboard visualization.
 
@@ -53,7 +65,7 @@ def prepare_dashboard_data(
             (with encoded nom_dep).
         predictions (pd.Series): The predicted yield values corresponding to the input
             data.
-        dep_encoder (LabelEncoder): Fitted encoder to decode nom_dep back to names.
+        dep_encoder (DepartmentEncoder): Fitted encoder to decode nom_dep back to names.
 
     Returns:
         pd.DataFrame: A DataFrame containing the original scenario data along with the
@@ -64,11 +76,11 @@ def prepare_dashboard_data(
     dashboard_data[GOLD_NOM_DEP] = dep_encoder.inverse_transform(
         dashboard_data[GOLD_NOM_DEP]
     )
-    return dashboard_data[DASHBOARD_COLUMNS]
+    return dashboard_data[list(DASHBOARD_COLUMNS)]
 
 
 def prediction_pipeline(
-    model: object, artifacts_dir: str, dep_encoder: LabelEncoder
+    model: object, artifacts_dir: str, dep_encoder: DepartmentEncoder
 ) -> None:
     """Run the prediction pipeline for future scenarios.
 
@@ -77,17 +89,41 @@ def prediction_pipeline(
     in the specified artifacts directory.
 
     Args:
-        model (object): The trained machine learning model to use for predictions.
+        model (object): The trained model to use for predictions. XGBoost models
+            are scored through their booster; any other model through `predict`.
         artifacts_dir (str): The directory where the prediction results will be saved.
-        dep_encoder (LabelEncoder): Fitted encoder for nom_dep.
+        dep_encoder (DepartmentEncoder): Fitted encoder for nom_dep.
     """
     # Prepare data for prediction
     scenario_126, scenario_245, scenario_585 = prepare_prediction_data(dep_encoder)
 
-    # Make predictions on each scenario (drop year — not a model feature)
-    pred_1 = model.predict(scenario_126.drop(columns=[GOLD_YEAR]))
-    pred_2 = model.predict(scenario_245.drop(columns=[GOLD_YEAR]))
-    pred_3 = model.predict(scenario_585.drop(columns=[GOLD_YEAR]))
+    # Make predictions on all scenarios (drop year — not a model feature).
+    # The three scenarios are scored in a single call; predictions are split
+    # back after.
+    feature_cols = list(GOLD_FEATURE_COLUMNS)
+    scenarios = (scenario_126, scenario_245, scenario_585)
+    if hasattr(model, "get_booster"):
+        # XGBoost: stack into one float32 matrix for inplace_predict. The input
+        # lives in host memory, so a copy of the (GPU-trained) booster predicts
+        # on CPU: with a CUDA booster, inplace_predict would fall back to
+        # building a DMatrix from host data.
+        booster = model.get_booster().copy()
+        booster.set_param({"device": "cpu"})
+        features = np.concatenate(
+            [
+                scenario[feature_cols].to_numpy(dtype=np.float32)
+                for scenario in scenarios
+            ]
+        )
+        predictions = booster.inplace_predict(features)
+    else:
+        # Any other fitted estimator with a predict method
+        features = pd.concat(
+            [scenario[feature_cols] for scenario in scenarios], ignore_index=True
+        )
+        predictions = np.asarray(model.predict(features))
+    split_points = np.cumsum([len(scenario) for scenario in scenarios[:-1]])
+    pred_1, pred_2, pred_3 = np.split(predictions, split_points)
 
     # Prepare dashboard data (decodes nom_dep back to names)
     scenario_126_dashboard_data = prepare_dashboard_data(
@@ -101,11 +137,18 @@ def prediction_pipeline(
     )
 
     # Save predictions to CSV files in artifacts directory
+    # (CSV is kept because the dashboard reads these files as-is)
     scenario_126_path = artifacts_dir / "scenario_126_predictions.csv"
     scenario_245_path = artifacts_dir / "scenario_245_predictions.csv"
     scenario_585_path = artifacts_dir / "scenario_585_predictions.csv"
 
-    scenario_126_dashboard_data.to_csv(scenario_126_path, index=False)
-    scenario_245_dashboard_data.to_csv(scenario_245_path, index=False)
-    scenario_585_dashboard_data.to_csv(scenario_585_path, index=False)
+    scenario_126_dashboard_data.to_csv(
+        scenario_126_path, index=False, float_format=PREDICTION_FLOAT_FORMAT
+    )
+    scenario_245_dashboard_data.to_csv(
+        scenario_245_path, index=False, float_format=PREDICTION_FLOAT_FORMAT
+    )
+    scenario_585_dashboard_data.to_csv(
+        scenario_585_path, index=False, float_format=PREDICTION_FLOAT_FORMAT
+    )
     return None